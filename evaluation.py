@@ -1,3 +1,10 @@
+import pandas as pd
+
+# Categorical dtype with 'optimal' as its only category, so the positive class
+# is code 0 and every other label becomes code -1.
+POSITIVE_CLASS_DTYPE = pd.CategoricalDtype(categories=['optimal'])
+
+
 def perform_categorical_evaluation(df, actual_col, predict_col):
     """
     Function to evaluate a pair of categorical columns.
@@ -5,36 +12,26 @@ def perform_categorical_evaluation(df, actual_col, predict_col):
     Returns confusion matrix and evaluation metrics.
     """
 
-    # --- Initialize confusion matrix counters ---
-    tp, tn, fp, fn = 0, 0, 0, 0
-
-    # --- Define which class is considered 'Positive' ---
-    # In this context, 'Optimal' is the positive class.
-    positive_class = 'optimal'
-
-    # --- Iterate through each row in the DataFrame ---
-    for index, row in df.iterrows():
-        try:
-            # 1. Get actual and predicted values, convert to lowercase and strip whitespace
-            actual_value = str(row[actual_col]).strip().lower()
-            predict_value = str(row[predict_col]).strip().lower()
-
-            # 2. Determine if actual and predicted values are positive cases
-            is_actual_positive = (actual_value == positive_class)
-            is_predict_positive = (predict_value == positive_class)
-
-            # 3. Update confusion matrix based on comparison
-            if is_predict_positive and is_actual_positive:
-                tp += 1  # True Positive
-            elif not is_predict_positive and not is_actual_positive:
-                tn += 1  # True Negative
-            elif is_predict_positive and not is_actual_positive:
-                fp += 1  # False Positive
-            elif not is_predict_positive and is_actual_positive:
-                fn += 1  # False Negative
-        except (ValueError, TypeError, KeyError):
-            # Skip row if there is missing data or other errors
-            continue
+    # --- Keep only rows where both actual and predicted values are present ---
+    mask = df[actual_col].notna() & df[predict_col].notna()
+
+    # --- Normalize both columns once, then compare int8 category codes ---
+    actual_codes = (
+        df.loc[mask, actual_col].astype("string").str.strip().str.lower()
+        .astype(POSITIVE_CLASS_DTYPE).cat.codes
+    )
+    predict_codes = (
+        df.loc[mask, predict_col].astype("string").str.strip().str.lower()
+        .astype(POSITIVE_CLASS_DTYPE).cat.codes
+    )
+    is_actual_positive = (actual_codes == 0).to_numpy()
+    is_predict_positive = (predict_codes == 0).to_numpy()
+
+    # --- Build confusion matrix from the boolean masks ---
+    tp = int((is_actual_positive & is_predict_positive).sum())  # True Positive
+    tn = int((~is_actual_positive & ~is_predict_positive).sum())  # True Negative
+    fp = int((~is_actual_positive & is_predict_positive).sum())  # False Positive
+    fn = int((is_actual_positive & ~is_predict_positive).sum())  # False Negative
 
     # --- Calculate total valid data points ---
     total_data = tp + tn + fp + fn
@@ -7,12 +7,14 @@ and implements fuzzy inference and defuzzification logic.
 """
 
 import numpy as np
+from numba import njit
 
 # Fuzzy set definitions for pH values.
-# Keys are linguistic terms, values are parameter lists for membership functions.
+# Keys are linguistic terms, values are trapezoid parameters [a, b, c, d];
+# triangular sets are written as trapezoids with b == c.
 PH_RANGES = {
     "Asam": [0, 0, 6, 7],  # Acidic
-    "Optimal": [6, 7, 8],  # Optimal
+    "Optimal": [6, 7, 7, 8],  # Optimal
     "Basa": [7, 8, 14, 14]  # Basic
 }
 
@@ -27,90 +29,121 @@ TDS_RANGES = {
 # Fuzzy set definitions for water temperature values.
 TEMPERATURE_RANGES = {
     "Dingin": [0, 0, 23, 25],  # Cold
-    "Optimal": [24, 27, 30],  # Optimal
+    "Optimal": [24, 27, 27, 30],  # Optimal
     "Panas": [28, 30, 45, 45]  # Hot
 }
 
 # Fuzzy output ranges for the final classification.
 OUTPUT_RANGES = {
-    "Tidak Normal": [0, 1, 2],
-    "Normal": [1, 2, 3]
+    "Tidak Normal": [0, 1, 1, 2],
+    "Normal": [1, 2, 2, 3]
 }
 
 
-def explode_array(arr):
-    """
-    Flattens and converts an array-like input to a list of floats.
+# Fuzzy inference rules applied by the Sugeno inference step.
+FUZZY_RULES = [
+    # (TDS, pH, Temp, Output)
+    ("Sangat Rendah", "Asam", "Dingin", 1),
+    ("Sangat Rendah", "Asam", "Optimal", 1),
+    ("Sangat Rendah", "Asam", "Panas", 1),
+    ("Sangat Rendah", "Optimal", "Dingin", 1),
+    ("Sangat Rendah", "Optimal", "Optimal", 1),
+    ("Sangat Rendah", "Optimal", "Panas", 1),
+    ("Sangat Rendah", "Basa", "Dingin", 1),
+    ("Sangat Rendah", "Basa", "Optimal", 1),
+    ("Sangat Rendah", "Basa", "Panas", 1),
+    ("Rendah", "Asam", "Dingin", 1),
+    ("Rendah", "Asam", "Optimal", 1),
+    ("Rendah", "Asam", "Panas", 1),
+    ("Rendah", "Optimal", "Dingin", 1),
+    ("Rendah", "Optimal", "Optimal", 1),
+    ("Rendah", "Optimal", "Panas", 1),
+    ("Rendah", "Basa", "Dingin", 1),
+    ("Rendah", "Basa", "Optimal", 1),
+    ("Rendah", "Basa", "Panas", 1),
+    ("Optimal", "Asam", "Dingin", 1),
+    ("Optimal", "Asam", "Optimal", 1),
+    ("Optimal", "Asam", "Panas", 1),
+    ("Optimal", "Optimal", "Dingin", 1),
+    ("Optimal", "Optimal", "Optimal", 2), # Should be 2 for "Optimal" output
+    ("Optimal", "Optimal", "Panas", 1),
+    ("Optimal", "Basa", "Dingin", 1),
+    ("Optimal", "Basa", "Optimal", 1),
+    ("Optimal", "Basa", "Panas", 1),
+    ("Tinggi", "Asam", "Dingin", 1),
+    ("Tinggi", "Asam", "Optimal", 1),
+    ("Tinggi", "Asam", "Panas", 1),
+    ("Tinggi", "Optimal", "Dingin", 1),
+    ("Tinggi", "Optimal", "Optimal", 1),
+    ("Tinggi", "Optimal", "Panas", 1),
+    ("Tinggi", "Basa", "Dingin", 1),
+    ("Tinggi", "Basa", "Optimal", 1),
+    ("Tinggi", "Basa", "Panas", 1),
+]
+
+# Weight applied to each input's membership degree when computing firing strength.
+RULE_WEIGHTS = {
+    "ph": 0.2,  # Weight for pH
+    "tds": 0.6,  # Weight for TDS
+    "water_temp": 0.2  # Weight for temperature
+}
 
-    Args:
-        arr: Array-like input.
 
-    Returns:
-        List of floats.
-    """
-    return [float(i) for i in np.array(arr).flatten()]
+# Contiguous (sets, 4) trapezoid parameter matrices per input, built once at
+# import time. Rows follow the order of the *_RANGES keys.
+_PH_PARAMS = np.array(list(PH_RANGES.values()), dtype=np.float64)
+_TDS_PARAMS = np.array(list(TDS_RANGES.values()), dtype=np.float64)
+_TEMP_PARAMS = np.array(list(TEMPERATURE_RANGES.values()), dtype=np.float64)
 
+# FUZZY_RULES flattened into per-input set indices and an output vector.
+_TDS_IDX = np.array([list(TDS_RANGES).index(rule[0]) for rule in FUZZY_RULES], dtype=np.int8)
+_PH_IDX = np.array([list(PH_RANGES).index(rule[1]) for rule in FUZZY_RULES], dtype=np.int8)
+_TEMP_IDX = np.array([list(TEMPERATURE_RANGES).index(rule[2]) for rule in FUZZY_RULES], dtype=np.int8)
+_OUTPUT = np.array([rule[3] for rule in FUZZY_RULES], dtype=np.float64)
 
-def membership_function(x, params):
-    """
-    General membership function for triangular or trapezoidal fuzzy sets.
+# RULE_WEIGHTS as plain floats, since Numba-compiled code cannot read dicts.
+_TDS_WEIGHT = RULE_WEIGHTS["tds"]
+_PH_WEIGHT = RULE_WEIGHTS["ph"]
+_TEMP_WEIGHT = RULE_WEIGHTS["water_temp"]
 
-    Args:
-        x: Input value.
-        params: List of parameters (length 3 for triangle, 4 for trapezoid).
 
-    Returns:
-        Membership degree (float).
+def membership_function(x, params):
     """
-    if len(params) == 3:
-        a, b, c = explode_array(params)
-        return np.maximum(np.minimum((x - a) / (b - a), (c - x) / (c - b)), 0)
-    elif len(params) == 4:
-        a, b, c, d = explode_array(params)
-        return np.maximum(np.minimum(np.minimum((x - a) / (b - a), 1), (d - x) / (d - c)), 0)
-    return None
+    General trapezoidal membership function; triangles are trapezoids with b == c.
 
-
-def fungsi_segitiga(x, params):
-    """
-    Triangular membership function.
+    Evaluated through _membership_matrix as a single-set matrix, so it works on
+    scalars and arrays alike.
 
     Args:
-        x: Input value.
-        params: List of three parameters [a, b, c].
+        x: Input value or array of values.
+        params: Array-like of four parameters [a, b, c, d].
 
     Returns:
-        Membership degree (float).
+        Membership degree (float or np.ndarray).
     """
-    a, b, c = [np.array(p) for p in params]
-    if x <= a or x >= c:
-        return 0.0
-    elif a < x <= b:
-        return (x - a) / (b - a)
-    elif b < x < c:
-        return (c - x) / (c - b)
+    return _membership_matrix(x, np.asarray(params, dtype=np.float64).reshape(1, 4))[..., 0][()]
 
 
-def fungsi_trapezium(x, params):
+def sparse_universe(*param_lists):
     """
-    Trapezoidal membership function.
+    Builds the smallest universe that still traces piecewise-linear fuzzy sets exactly.
+
+    Shoulders such as [0, 0, 6, 7] are zero exactly at their outer edge, so that
+    edge is moved just inside the universe where the shoulder is still 1.
 
     Args:
-        x: Input value.
-        params: List of four parameters [a, b, c, d].
+        *param_lists: Parameter lists of the fuzzy sets sharing the universe.
 
     Returns:
-        Membership degree (float).
+        Sorted np.ndarray of the unique anchor points.
     """
-    a, b, c, d = [np.array(p) for p in params]
-    if x <= a or x >= d:
-        return 0
-    elif a < x <= b:
-        return (x - a) / (b - a)
-    elif b < x <= c:
-        return 1
-    elif c < x < d:
-        return (d - x) / (d - c)
+    anchors = np.unique(np.concatenate(param_lists)).astype(np.float64)
+    # Offset well above the 1e-12 slope floor in membership_function.
+    left_edges = [params[0] for params in param_lists if params[0] == params[1]]
+    right_edges = [params[-1] for params in param_lists if params[-2] == params[-1]]
+    anchors = np.where(np.isin(anchors, left_edges), anchors + 1e-6, anchors)
+    anchors = np.where(np.isin(anchors, right_edges), anchors - 1e-6, anchors)
+    return anchors
 
 
 def ph_membership(x):
@@ -124,9 +157,9 @@ def ph_membership(x):
         Dict of membership degrees for each pH fuzzy set.
     """
     return {
-        "Asam": fungsi_trapezium(x, explode_array(PH_RANGES["Asam"])),
-        "Optimal": fungsi_segitiga(x, explode_array(PH_RANGES["Optimal"])),
-        "Basa": fungsi_trapezium(x, explode_array(PH_RANGES["Basa"]))
+        "Asam": membership_function(x, _PH_PARAMS[0]),
+        "Optimal": membership_function(x, _PH_PARAMS[1]),
+        "Basa": membership_function(x, _PH_PARAMS[2])
     }
 
 
@@ -141,10 +174,10 @@ def tds_membership(x):
         Dict of membership degrees for each TDS fuzzy set.
     """
     return {
-        "Sangat Rendah": fungsi_trapezium(x, explode_array(TDS_RANGES["Sangat Rendah"])),
-        "Rendah": fungsi_trapezium(x, explode_array(TDS_RANGES["Rendah"])),
-        "Optimal": fungsi_trapezium(x, explode_array(TDS_RANGES["Optimal"])),
-        "Tinggi": fungsi_trapezium(x, explode_array(TDS_RANGES["Tinggi"]))
+        "Sangat Rendah": membership_function(x, _TDS_PARAMS[0]),
+        "Rendah": membership_function(x, _TDS_PARAMS[1]),
+        "Optimal": membership_function(x, _TDS_PARAMS[2]),
+        "Tinggi": membership_function(x, _TDS_PARAMS[3])
     }
 
 
@@ -159,98 +192,101 @@ def temp_membership(x):
         Dict of membership degrees for each temperature fuzzy set.
     """
     return {
-        "Dingin": fungsi_trapezium(x, explode_array(TEMPERATURE_RANGES["Dingin"])),
-        "Optimal": fungsi_segitiga(x, explode_array(TEMPERATURE_RANGES["Optimal"])),
-        "Panas": fungsi_trapezium(x, explode_array(TEMPERATURE_RANGES["Panas"]))
+        "Dingin": membership_function(x, _TEMP_PARAMS[0]),
+        "Optimal": membership_function(x, _TEMP_PARAMS[1]),
+        "Panas": membership_function(x, _TEMP_PARAMS[2])
     }
 
 
-def fuzzy_rules(x1, x2, x3):
+def _membership_matrix(x, params):
     """
-    Applies fuzzy inference rules and computes firing strengths.
+    Evaluates every fuzzy set of a variable by broadcasting against its parameter matrix.
+
+    A tiny epsilon guards degenerate shoulders such as [0, 0, 6, 7].
 
     Args:
-        x1: Dict of TDS membership degrees.
-        x2: Dict of pH membership degrees.
-        x3: Dict of temperature membership degrees.
+        x: Input value, or array of input values with shape (N,).
+        params: Trapezoid parameter matrix with shape (sets, 4) (e.g. _PH_PARAMS).
 
     Returns:
-        List of dicts with firing strength and output for each rule.
+        Array of membership degrees with shape (sets,) or (N, sets).
     """
-    rules = [
-        # (TDS, pH, Temp, Output)
-        ("Sangat Rendah", "Asam", "Dingin", 1),
-        ("Sangat Rendah", "Asam", "Optimal", 1),
-        ("Sangat Rendah", "Asam", "Panas", 1),
-        ("Sangat Rendah", "Optimal", "Dingin", 1),
-        ("Sangat Rendah", "Optimal", "Optimal", 1),
-        ("Sangat Rendah", "Optimal", "Panas", 1),
-        ("Sangat Rendah", "Basa", "Dingin", 1),
-        ("Sangat Rendah", "Basa", "Optimal", 1),
-        ("Sangat Rendah", "Basa", "Panas", 1),
-        ("Rendah", "Asam", "Dingin", 1),
-        ("Rendah", "Asam", "Optimal", 1),
-        ("Rendah", "Asam", "Panas", 1),
-        ("Rendah", "Optimal", "Dingin", 1),
-        ("Rendah", "Optimal", "Optimal", 1),
-        ("Rendah", "Optimal", "Panas", 1),
-        ("Rendah", "Basa", "Dingin", 1),
-        ("Rendah", "Basa", "Optimal", 1),
-        ("Rendah", "Basa", "Panas", 1),
-        ("Optimal", "Asam", "Dingin", 1),
-        ("Optimal", "Asam", "Optimal", 1),
-        ("Optimal", "Asam", "Panas", 1),
-        ("Optimal", "Optimal", "Dingin", 1),
-        ("Optimal", "Optimal", "Optimal", 2), # Should be 2 for "Optimal" output
-        ("Optimal", "Optimal", "Panas", 1),
-        ("Optimal", "Basa", "Dingin", 1),
-        ("Optimal", "Basa", "Optimal", 1),
-        ("Optimal", "Basa", "Panas", 1),
-        ("Tinggi", "Asam", "Dingin", 1),
-        ("Tinggi", "Asam", "Optimal", 1),
-        ("Tinggi", "Asam", "Panas", 1),
-        ("Tinggi", "Optimal", "Dingin", 1),
-        ("Tinggi", "Optimal", "Optimal", 1),
-        ("Tinggi", "Optimal", "Panas", 1),
-        ("Tinggi", "Basa", "Dingin", 1),
-        ("Tinggi", "Basa", "Optimal", 1),
-        ("Tinggi", "Basa", "Panas", 1),
-    ]
-    results = []
-    weights = {
-        "ph": 0.2,  # Weight for pH
-        "tds": 0.6,  # Weight for TDS
-        "water_temp": 0.2  # Weight for temperature
-    }
-    for rule in rules:
-        tds, ph, suhu, output = rule
-        if tds in x1 and ph in x2 and suhu in x3:
-            firing_strength = min(
-                x1[tds] * weights["tds"],
-                x2[ph] * weights["ph"],
-                x3[suhu] * weights["water_temp"]
-            )
-            results.append({"firing_strength": firing_strength, "output": output})
-    if not results:
-        results.append({"firing_strength": 0, "output": 0})
-    return results
-
-
-def defuzzification(rules):
+    x = np.asarray(x, dtype=np.float64)[..., None]
+    a, b, c, d = params.T
+    rise = (x - a) / np.maximum(b - a, 1e-12)
+    fall = (d - x) / np.maximum(d - c, 1e-12)
+    return np.clip(np.minimum(np.minimum(rise, 1.0), fall), 0.0, 1.0)
+
+
+@njit(cache=True)
+def _trapezoid_scalar(x, params):
     """
-    Defuzzifies the fuzzy output to a crisp value using weighted average.
+    Trapezoidal membership degree of a single value, compiled with Numba.
 
     Args:
-        rules: List of dicts with 'firing_strength' and 'output'.
+        x: Input value.
+        params: Array of four parameters [a, b, c, d].
+
+    Returns:
+        Membership degree (float).
+    """
+    a, b, c, d = params[0], params[1], params[2], params[3]
+    if x <= a or x >= d:
+        return 0.0
+    elif x < b:
+        return (x - a) / (b - a)
+    elif x <= c:
+        return 1.0
+    return (d - x) / (d - c)
+
+
+@njit(cache=True)
+def _z_scalar(tds, ph, temp):
+    """
+    Runs the full fuzzy pipeline for one reading as native code.
+
+    A missing (NaN) reading yields NaN, matching get_z_result_batch. Other
+    inputs are clamped to each variable's universe first, which leaves the
+    result unchanged since every fuzzy set is zero at and beyond its bounds.
+
+    Args:
+        tds: TDS value.
+        ph: pH value.
+        temp: Water temperature value.
 
     Returns:
         Defuzzified crisp value (float).
     """
-    numerator = sum(rule["firing_strength"] * rule["output"] for rule in rules)
-    denominator = sum(rule["firing_strength"] for rule in rules)
+    if np.isnan(tds) or np.isnan(ph) or np.isnan(temp):
+        return np.nan
+
+    tds = min(max(tds, _TDS_PARAMS[0, 0]), _TDS_PARAMS[-1, 3])
+    ph = min(max(ph, _PH_PARAMS[0, 0]), _PH_PARAMS[-1, 3])
+    temp = min(max(temp, _TEMP_PARAMS[0, 0]), _TEMP_PARAMS[-1, 3])
+
+    tds_mu = np.empty(_TDS_PARAMS.shape[0])
+    for k in range(_TDS_PARAMS.shape[0]):
+        tds_mu[k] = _trapezoid_scalar(tds, _TDS_PARAMS[k])
+    ph_mu = np.empty(_PH_PARAMS.shape[0])
+    for k in range(_PH_PARAMS.shape[0]):
+        ph_mu[k] = _trapezoid_scalar(ph, _PH_PARAMS[k])
+    temp_mu = np.empty(_TEMP_PARAMS.shape[0])
+    for k in range(_TEMP_PARAMS.shape[0]):
+        temp_mu[k] = _trapezoid_scalar(temp, _TEMP_PARAMS[k])
+
+    numerator = 0.0
+    denominator = 0.0
+    for i in range(_OUTPUT.shape[0]):
+        firing_strength = min(
+            tds_mu[_TDS_IDX[i]] * _TDS_WEIGHT,
+            ph_mu[_PH_IDX[i]] * _PH_WEIGHT,
+            temp_mu[_TEMP_IDX[i]] * _TEMP_WEIGHT
+        )
+        numerator += firing_strength * _OUTPUT[i]
+        denominator += firing_strength
     if denominator == 0:
-        return 0
-    return round(numerator / denominator, 2)
+        return 0.0
+    return np.rint(numerator / denominator * 100.0) / 100.0
 
 
 def get_z_result(row):
@@ -263,8 +299,35 @@ def get_z_result(row):
     Returns:
         float: The defuzzified crisp value representing the water quality classification.
     """
-    tds_mf = tds_membership(row['tds'])
-    ph_mf = ph_membership(row['ph'])
-    temp_mf = temp_membership(row['water_temp'])
-    rules = fuzzy_rules(x1=tds_mf, x2=ph_mf, x3=temp_mf)
-    return defuzzification(rules)
\ No newline at end of file
+    return _z_scalar(float(row['tds']), float(row['ph']), float(row['water_temp']))
+
+
+def get_z_result_batch(tds_arr, ph_arr, temp_arr):
+    """
+    Calculates the defuzzified water quality result for whole columns at once.
+
+    Args:
+        tds_arr: Array-like of TDS values.
+        ph_arr: Array-like of pH values.
+        temp_arr: Array-like of water temperature values.
+
+    Returns:
+        np.ndarray: Defuzzified crisp values, one per input row.
+    """
+    tds_mu = _membership_matrix(tds_arr, _TDS_PARAMS)
+    ph_mu = _membership_matrix(ph_arr, _PH_PARAMS)
+    temp_mu = _membership_matrix(temp_arr, _TEMP_PARAMS)
+
+    # Firing strength of every rule for every row, shape (N, len(FUZZY_RULES)).
+    mu = np.minimum.reduce([
+        tds_mu[:, _TDS_IDX] * RULE_WEIGHTS["tds"],
+        ph_mu[:, _PH_IDX] * RULE_WEIGHTS["ph"],
+        temp_mu[:, _TEMP_IDX] * RULE_WEIGHTS["water_temp"]
+    ])
+
+    numerator = (mu * _OUTPUT).sum(axis=1)
+    denominator = mu.sum(axis=1)
+    z = np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator != 0)
+    # Fixed-point rounding to 2 decimals. On near-ties such as 1.115 this can
+    # land 0.01 away from round(x, 2), since x * 100 is not exactly representable.
+    return np.rint(z * 100.0) / 100.0
@@ -1,77 +1,85 @@
 import os
 import matplotlib.pyplot as plt
 
+# Membership plots are piecewise linear, so collinear points can be simplified away.
+# Applied only inside the export functions so the caller's settings stay untouched.
+EXPORT_RC_PARAMS = {
+    'figure.max_open_warning': 0,
+    'agg.path.chunksize': 10000,
+    'path.simplify': True,
+}
+
+Y_LABEL = 'Membership Degree'
+
+
+def _input_plot_specs(
+    x_ph, ph_acidic, ph_neutral, ph_alkali,
+    x_tds, tds_lowest, tds_low, tds_medium, tds_high,
+    x_temp, temp_cold, temp_normal, temp_hot
+):
+    # (file name, x label, title, [(x, y, label, color), ...]) per input variable
+    return [
+        ('ph_membership.png', 'pH', 'Acidity Level (pH)', [
+            (x_ph, ph_acidic, 'Acidic', 'blue'),
+            (x_ph, ph_neutral, 'Optimal', 'green'),
+            (x_ph, ph_alkali, 'Alkaline', 'red'),
+        ]),
+        ('tds_membership.png', 'TDS (ppm)', 'Total Dissolved Solids (TDS)', [
+            (x_tds, tds_lowest, 'Very Low', 'blue'),
+            (x_tds, tds_low, 'Low', 'orange'),
+            (x_tds, tds_medium, 'Optimal', 'green'),
+            (x_tds, tds_high, 'High', 'red'),
+        ]),
+        ('temp_membership.png', 'Water Temperature (°C)', 'Water Temperature', [
+            (x_temp, temp_cold, 'Cold', 'blue'),
+            (x_temp, temp_normal, 'Optimal', 'green'),
+            (x_temp, temp_hot, 'Hot', 'red'),
+        ]),
+    ]
+
+
+def _draw_membership(ax, x_label, title, curves):
+    for x, y, label, color in curves:
+        ax.plot(x, y, label=label, color=color)
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(Y_LABEL)
+    ax.set_title(title)
+    ax.legend()
+
+
 def plot_and_save_membership_functions(
     x_ph, ph_acidic, ph_neutral, ph_alkali,
     x_tds, tds_lowest, tds_low, tds_medium, tds_high,
     x_temp, temp_cold, temp_normal, temp_hot,
     x_output, output_not_normal, output_normal,
-    output_dir='images/membership_functions', width=6, height=4
+    output_dir='images/membership_functions', width=6, height=4, dpi=80
 ):
     os.makedirs(output_dir, exist_ok=True)
-    y_label = 'Membership Degree'
-
-    # pH plot
-    plt.figure(figsize=(width, height))
-    plt.plot(x_ph, ph_acidic, label='Acidic', color='blue')
-    plt.plot(x_ph, ph_neutral, label='Optimal', color='green')
-    plt.plot(x_ph, ph_alkali, label='Alkaline', color='red')
-    plt.xlabel('pH')
-    plt.ylabel(y_label)
-    plt.title('Acidity Level (pH)')
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'ph_membership.png'))
-    plt.show()
-    plt.close()
-
-    # TDS plot
-    plt.figure(figsize=(width, height))
-    plt.plot(x_tds, tds_lowest, label='Very Low', color='blue')
-    plt.plot(x_tds, tds_low, label='Low', color='orange')
-    plt.plot(x_tds, tds_medium, label='Optimal', color='green')
-    plt.plot(x_tds, tds_high, label='High', color='red')
-    plt.xlabel('TDS (ppm)')
-    plt.ylabel(y_label)
-    plt.title('Total Dissolved Solids (TDS)')
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'tds_membership.png'))
-    plt.show()
-    plt.close()
-
-    # Water Temperature plot
-    plt.figure(figsize=(width, height))
-    plt.plot(x_temp, temp_cold, label='Cold', color='blue')
-    plt.plot(x_temp, temp_normal, label='Optimal', color='green')
-    plt.plot(x_temp, temp_hot, label='Hot', color='red')
-    plt.xlabel('Water Temperature (°C)')
-    plt.ylabel(y_label)
-    plt.title('Water Temperature')
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'temp_membership.png'))
-    plt.show()
-    plt.close()
-
-    # Output Condition plot
-    plt.figure(figsize=(width, height))
-    plt.plot(x_output, output_not_normal, label='Abnormal', color='red')
-    plt.plot(x_output, output_normal, label='Normal', color='green')
-    plt.xlabel('Environment Condition')
-    plt.ylabel(y_label)
-    plt.title('Environment Condition')
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'output_membership.png'))
-    plt.show()
-    plt.close()
+
+    specs = _input_plot_specs(
+        x_ph, ph_acidic, ph_neutral, ph_alkali,
+        x_tds, tds_lowest, tds_low, tds_medium, tds_high,
+        x_temp, temp_cold, temp_normal, temp_hot
+    )
+    specs.append(('output_membership.png', 'Environment Condition', 'Environment Condition', [
+        (x_output, output_not_normal, 'Abnormal', 'red'),
+        (x_output, output_normal, 'Normal', 'green'),
+    ]))
+
+    with plt.rc_context(EXPORT_RC_PARAMS):
+        fig, ax = plt.subplots(figsize=(width, height))
+        for file_name, x_label, title, curves in specs:
+            ax.clear()
+            _draw_membership(ax, x_label, title, curves)
+            fig.tight_layout()
+            fig.savefig(os.path.join(output_dir, file_name), dpi=dpi)
+        plt.close(fig)
 
     export_input_membership_subplot(
         x_ph, ph_acidic, ph_neutral, ph_alkali,
         x_tds, tds_lowest, tds_low, tds_medium, tds_high,
         x_temp, temp_cold, temp_normal, temp_hot,
-        output_dir="images/"
+        output_dir="images/", dpi=dpi
     )
 
 
@@ -79,45 +87,23 @@ def export_input_membership_subplot(
     x_ph, ph_acidic, ph_neutral, ph_alkali,
     x_tds, tds_lowest, tds_low, tds_medium, tds_high,
     x_temp, temp_cold, temp_normal, temp_hot,
-    output_dir='images/membership_functions', width=6, height=12
+    output_dir='images/membership_functions', width=6, height=12, dpi=80
 ):
     os.makedirs(output_dir, exist_ok=True)
-    y_label = 'Membership Degree'
-
-    fig, axes = plt.subplots(3, 1, figsize=(width, height))
-
-    # pH subplot
-    axes[0].plot(x_ph, ph_acidic, label='Acid', color='blue')
-    axes[0].plot(x_ph, ph_neutral, label='Optimal', color='green')
-    axes[0].plot(x_ph, ph_alkali, label='Alkaline', color='red')
-    axes[0].set_xlabel('pH')
-    axes[0].set_ylabel(y_label)
-    axes[0].set_title('Acidity Level (pH)')
-    axes[0].legend()
-    axes[0].grid(True)
-
-    # TDS subplot
-    axes[1].plot(x_tds, tds_lowest, label='Lower', color='blue')
-    axes[1].plot(x_tds, tds_low, label='Low', color='orange')
-    axes[1].plot(x_tds, tds_medium, label='Optimal', color='green')
-    axes[1].plot(x_tds, tds_high, label='High', color='red')
-    axes[1].set_xlabel('TDS (ppm)')
-    axes[1].set_ylabel(y_label)
-    axes[1].set_title('Total Dissolved Solids (TDS)')
-    axes[1].legend()
-    axes[1].grid(True)
-
-    # Water Temperature subplot
-    axes[2].plot(x_temp, temp_cold, label='Cold', color='blue')
-    axes[2].plot(x_temp, temp_normal, label='Optimal', color='green')
-    axes[2].plot(x_temp, temp_hot, label='Hot', color='red')
-    axes[2].set_xlabel('Water Temperature (°C)')
-    axes[2].set_ylabel(y_label)
-    axes[2].set_title('Water Temperature')
-    axes[2].legend()
-    axes[2].grid(True)
-
-    plt.tight_layout()
-    save_path = os.path.join(output_dir, 'input_membership_subplot.png')
-    plt.savefig(save_path)
-    plt.close()
\ No newline at end of file
+
+    specs = _input_plot_specs(
+        x_ph, ph_acidic, ph_neutral, ph_alkali,
+        x_tds, tds_lowest, tds_low, tds_medium, tds_high,
+        x_temp, temp_cold, temp_normal, temp_hot
+    )
+
+    with plt.rc_context(EXPORT_RC_PARAMS):
+        fig, axes = plt.subplots(len(specs), 1, figsize=(width, height))
+        for ax, (_, x_label, title, curves) in zip(axes, specs):
+            _draw_membership(ax, x_label, title, curves)
+            ax.grid(True)
+
+        fig.tight_layout()
+        save_path = os.path.join(output_dir, 'input_membership_subplot.png')
+        fig.savefig(save_path, dpi=dpi)
+        plt.close(fig)